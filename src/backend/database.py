@@ -2,33 +2,65 @@
 MongoDB database configuration and setup for Mergington High School API
 """
 
+import os
+from functools import lru_cache
 from pymongo import MongoClient
 from argon2 import PasswordHasher
 
-# Connect to MongoDB
-client = MongoClient('mongodb://localhost:27017/')
+# Connect to MongoDB (override the local dev server with MONGODB_URI)
+client = MongoClient(os.environ.get('MONGODB_URI', 'mongodb://localhost:27017/'))
 db = client['mergington_high']
 activities_collection = db['activities']
 teachers_collection = db['teachers']
 
+# Shared Argon2 hasher, reused across calls
+password_hasher = PasswordHasher()
+
 # Methods
 def hash_password(password):
     """Hash password using Argon2"""
-    ph = PasswordHasher()
-    return ph.hash(password)
+    return password_hasher.hash(password)
+
+def is_empty(collection):
+    """Check whether a collection has no documents without counting them all"""
+    return collection.find_one({}, {"_id": 1}) is None
+
+@lru_cache(maxsize=None)
+def seed_teacher_documents():
+    """Build seed teacher documents, hashing each password only once per process"""
+    return tuple(
+        {
+            "_id": teacher["username"],
+            **teacher,
+            "password": hash_password(teacher["password"])
+        }
+        for teacher in initial_teachers
+    )
 
 def init_database():
     """Initialize database if empty"""
 
     # Initialize activities if empty
-    if activities_collection.count_documents({}) == 0:
-        for name, details in initial_activities.items():
-            activities_collection.insert_one({"_id": name, **details})
-            
+    if is_empty(activities_collection):
+        activities_collection.insert_many(
+            [{"_id": name, **details} for name, details in initial_activities.items()],
+            ordered=False
+        )
+
     # Initialize teacher accounts if empty
-    if teachers_collection.count_documents({}) == 0:
-        for teacher in initial_teachers:
-            teachers_collection.insert_one({"_id": teacher["username"], **teacher})
+    if is_empty(teachers_collection):
+        # Seed passwords are hashed on first use, not at import time
+        teachers_collection.insert_many(
+            [dict(teacher) for teacher in seed_teacher_documents()],
+            ordered=False
+        )
+
+    # Index the fields used by the activity day/time filters (idempotent)
+    activities_collection.create_index("schedule_details.days")
+    activities_collection.create_index([
+        ("schedule_details.start_time", 1),
+        ("schedule_details.end_time", 1)
+    ])
 
 # Initial database if empty
 initial_activities = {
@@ -170,19 +202,19 @@ initial_teachers = [
     {
         "username": "mrodriguez",
         "display_name": "Ms. Rodriguez",
-        "password": hash_password("art123"),
+        "password": "art123",
         "role": "teacher"
      },
     {
         "username": "mchen",
         "display_name": "Mr. Chen",
-        "password": hash_password("chess456"),
+        "password": "chess456",
         "role": "teacher"
     },
     {
         "username": "principal",
         "display_name": "Principal Martinez",
-        "password": hash_password("admin789"),
+        "password": "admin789",
         "role": "admin"
     }
 ]
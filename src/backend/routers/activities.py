@@ -69,12 +69,12 @@ def signup_for_activity(activity_name: str, email: str, teacher_username: Option
     if not teacher_username:
         raise HTTPException(status_code=401, detail="Authentication required for this action")
     
-    teacher = teachers_collection.find_one({"_id": teacher_username})
+    teacher = teachers_collection.find_one({"_id": teacher_username}, {"_id": 1})
     if not teacher:
         raise HTTPException(status_code=401, detail="Invalid teacher credentials")
     
     # Get the activity
-    activity = activities_collection.find_one({"_id": activity_name})
+    activity = activities_collection.find_one({"_id": activity_name}, {"participants": 1})
     if not activity:
         raise HTTPException(status_code=404, detail="Activity not found")
 
@@ -83,14 +83,18 @@ def signup_for_activity(activity_name: str, email: str, teacher_username: Option
         raise HTTPException(
             status_code=400, detail="Already signed up for this activity")
 
-    # Add student to participants
+    # Add student to participants ($addToSet keeps concurrent signups unique)
     result = activities_collection.update_one(
         {"_id": activity_name},
-        {"$push": {"participants": email}}
+        {"$addToSet": {"participants": email}}
     )
 
-    if result.modified_count == 0:
+    if result.matched_count == 0:
         raise HTTPException(status_code=500, detail="Failed to update activity")
+
+    if result.modified_count == 0:
+        raise HTTPException(
+            status_code=400, detail="Already signed up for this activity")
     
     return {"message": f"Signed up {email} for {activity_name}"}
 
@@ -101,12 +105,12 @@ def unregister_from_activity(activity_name: str, email: str, teacher_username: O
     if not teacher_username:
         raise HTTPException(status_code=401, detail="Authentication required for this action")
     
-    teacher = teachers_collection.find_one({"_id": teacher_username})
+    teacher = teachers_collection.find_one({"_id": teacher_username}, {"_id": 1})
     if not teacher:
         raise HTTPException(status_code=401, detail="Invalid teacher credentials")
     
     # Get the activity
-    activity = activities_collection.find_one({"_id": activity_name})
+    activity = activities_collection.find_one({"_id": activity_name}, {"participants": 1})
     if not activity:
         raise HTTPException(status_code=404, detail="Activity not found")
 